@@ -7,8 +7,6 @@ sys.path.insert(0, path.join(path.dirname(path.realpath(__file__)), '..'))
 
 
 from typing import TYPE_CHECKING
-from collections import deque
-from time import time
 import pytest_asyncio
 import pytest
 
@@ -26,13 +24,9 @@ MOCK_LOCALE_MAPPING = {topgg.Locale.ENGLISH: 'test', topgg.Locale.JAPANESE: 'tes
 
 
 @pytest_asyncio.fixture
-async def client(
-  monkeypatch: pytest.MonkeyPatch,
-) -> 'AsyncGenerator[topgg.Client, None]':
+async def client() -> 'AsyncGenerator[topgg.Client, None]':
   client = topgg.Client(MOCK_TOKEN)
 
-  monkeypatch.setattr(topgg.Ratelimiter, '_calls', deque([time()]))
-
   yield client
   await client.close()
 
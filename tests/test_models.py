@@ -0,0 +1,64 @@
+from collections.abc import Callable
+from os.path import join
+import json
+import pytest
+
+import topgg
+
+from util import CURRENT_DIR
+
+
+def load_mock(name: str) -> dict:
+  with open(join(CURRENT_DIR, f'mocks/{name}.json'), 'r', encoding='utf-8') as file:
+    return json.load(file)
+
+
+@pytest.mark.parametrize(
+  ('cls', 'mock_name', 'get_json', 'id_key'),
+  (
+    (topgg.Project, 'get_self', lambda json: json, 'id'),
+    (
+      topgg.PartialProject,
+      'vote_create_payload',
+      lambda json: json['data']['project'],
+      'id',
+    ),
+    (topgg.User, 'vote_create_payload', lambda json: json['data']['user'], 'id'),
+    (
+      topgg.IntegrationCreatePayload,
+      'integration_create_payload',
+      lambda json: json['data'],
+      'connection_id',
+    ),
+    (
+      topgg.IntegrationDeletePayload,
+      'integration_delete_payload',
+      lambda json: json['data'],
+      'connection_id',
+    ),
+    (
+      topgg.VoteCreatePayload,
+      'vote_create_payload',
+      lambda json: json['data'],
+      'id',
+    ),
+  ),
+)
+def test_models_hash_matches_eq(
+  cls: type, mock_name: str, get_json: Callable[[dict], dict], id_key: str
+) -> None:
+  a = cls(get_json(load_mock(mock_name)))
+  b = cls(get_json(load_mock(mock_name)))
+
+  assert a is not b
+  assert a == b
+  assert hash(a) == hash(b)
+  assert len({a, b}) == 1
+
+  other_json = get_json(load_mock(mock_name))
+  other_json[id_key] = str(int(other_json[id_key]) + 1)
+  c = cls(other_json)
+
+  assert a != c
+  assert hash(a) != hash(c)
+  assert len({a, b, c}) == 2
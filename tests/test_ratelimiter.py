@@ -0,0 +1,93 @@
+from time import monotonic
+import asyncio
+import pytest
+
+from topgg import Ratelimiter
+
+
+@pytest.mark.asyncio
+async def test_Ratelimiter_delay_works() -> None:
+  ratelimiter = Ratelimiter(2, 0.2)
+
+  start = monotonic()
+
+  for _ in range(2):
+    async with ratelimiter:
+      pass
+
+  assert monotonic() - start < 0.05
+
+  async with ratelimiter:
+    pass
+
+  assert monotonic() - start >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_Ratelimiter_maximum_delay_threshold_works() -> None:
+  ratelimiter = Ratelimiter(1, 14400)
+
+  start = monotonic()
+
+  for _ in range(3):
+    async with ratelimiter:
+      pass
+
+  assert monotonic() - start < 0.05
+
+
+@pytest.mark.asyncio
+async def test_Ratelimiter_cancelled_delay_releases_token() -> None:
+  ratelimiter = Ratelimiter(1, 0.2)
+
+  async with ratelimiter:
+    pass
+
+  async def wait() -> None:
+    async with ratelimiter:
+      pass
+
+  tasks = [asyncio.create_task(wait()) for _ in range(5)]
+
+  await asyncio.sleep(0.01)
+
+  for task in tasks:
+    task.cancel()
+
+  await asyncio.gather(*tasks, return_exceptions=True)
+
+  start = monotonic()
+
+  async with ratelimiter:
+    pass
+
+  assert monotonic() - start < 0.3
+
+
+@pytest.mark.asyncio
+async def test_Ratelimiter_never_exceeds_max_calls_per_period(
+  monkeypatch: pytest.MonkeyPatch,
+) -> None:
+  clock = 0.0
+
+  async def sleep(delay: float) -> None:
+    nonlocal clock
+    clock += delay
+
+  monkeypatch.setattr('topgg.ratelimiter.monotonic', lambda: clock)
+  monkeypatch.setattr('topgg.ratelimiter.asyncio.sleep', sleep)
+
+  ratelimiter = Ratelimiter(99)
+  calls = []
+
+  for burst_at in (0.0, 0.5, 1.2, 1.3):
+    clock = max(clock, burst_at)
+
+    for _ in range(99):
+      async with ratelimiter:
+        calls.append(clock)
+
+  assert len(calls) == 99 * 4
+
+  for first, last in zip(calls, calls[99:]):
+    assert last - first >= 1.0
@@ -0,0 +1,48 @@
+from collections.abc import Callable
+from importlib import reload
+from typing import TYPE_CHECKING
+from types import ModuleType
+import sys
+import pytest
+
+if TYPE_CHECKING:
+  from collections.abc import Generator
+
+import topgg.util
+
+
+SAMPLE = {'id': '123456', 'headline': {'en': 'Hello', 'ja': 'こんにちは'}, 'tags': []}
+StdlibUtilFixture = Callable[[], ModuleType]
+
+
+@pytest.fixture
+def stdlib_util(
+  monkeypatch: pytest.MonkeyPatch,
+) -> 'Generator[StdlibUtilFixture, None, None]':
+  def load_stdlib_util() -> ModuleType:
+    monkeypatch.setitem(sys.modules, 'orjson', None)
+
+    return reload(topgg.util)
+
+  yield load_stdlib_util
+
+  monkeypatch.undo()
+  reload(topgg.util)
+
+
+def test_util_json_works() -> None:
+  output = topgg.util.json_dumps(SAMPLE)
+
+  assert isinstance(output, bytes)
+  assert topgg.util.json_loads(output) == SAMPLE
+
+
+def test_util_json_stdlib_fallback_works(stdlib_util: StdlibUtilFixture) -> None:
+  orjson = pytest.importorskip('orjson')
+  util = stdlib_util()
+
+  output = util.json_dumps(SAMPLE)
+
+  assert util.json_loads.__module__ == 'json'
+  assert output == orjson.dumps(SAMPLE)
+  assert util.json_loads(output) == SAMPLE
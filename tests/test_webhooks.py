@@ -19,13 +19,16 @@ from util import _test_attributes, CURRENT_DIR
 
 MOCK_SECRET = 'testsecret1234'
 MOCK_TRACE = 'trace'
+MOCK_CLIENT_MAX_SIZE = 1024 * 1024
 WebhooksFixture = tuple[topgg.Webhooks, test_utils.TestClient]
 WebhooksSignatureFixture = Callable[[str], tuple[str, str]]
 
 
 @pytest_asyncio.fixture
 async def webhooks() -> 'AsyncGenerator[WebhooksFixture, None]':
-  app = test_utils.TestClient(test_utils.TestServer(web.Application()))
+  app = test_utils.TestClient(
+    test_utils.TestServer(web.Application(client_max_size=MOCK_CLIENT_MAX_SIZE))
+  )
   webhooks = topgg.Webhooks('/webhook', MOCK_SECRET, app=app)
 
   for payload_type in topgg.PayloadType:
@@ -140,16 +143,127 @@ async def test_Webhooks_error_handling_works(
     assert response.status == 403
     assert (await response.json()).get('error') == 'Invalid signature'
 
+    response = await client.post(
+      '/webhook',
+      data=payload,
+      headers={
+        'Content-Type': 'application/json',
+        'x-topgg-signature': f't={t}',
+        'x-topgg-trace': MOCK_TRACE,
+      },
+    )
+
+    assert response.status == 422
+    assert (await response.json()).get('error') == 'Invalid signature'
+
+    response = await client.post(
+      '/webhook',
+      data=payload,
+      headers={
+        'Content-Type': 'application/json',
+        'x-topgg-signature': f't={10**400},{topgg.API_VERSION}={signature}',
+        'x-topgg-trace': MOCK_TRACE,
+      },
+    )
+
+    assert response.status == 422
+    assert (await response.json()).get('error') == 'Invalid signature'
+
+    response = await client.post(
+      '/webhook',
+      data=payload,
+      headers={
+        'Content-Type': 'application/json',
+        'x-topgg-signature': f't={t},{topgg.API_VERSION}=éé',
+        'x-topgg-trace': MOCK_TRACE,
+      },
+    )
+
+    assert response.status == 403
+    assert (await response.json()).get('error') == 'Invalid signature'
+
+    response = await client.post(
+      '/webhook',
+      data=payload,
+      headers={
+        'Content-Type': 'application/json',
+        'x-topgg-signature': f't={int(t) - 3600},{topgg.API_VERSION}={signature}',
+        'x-topgg-trace': MOCK_TRACE,
+      },
+    )
+
+    assert response.status == 403
+    assert (await response.json()).get('error') == 'Invalid signature'
+
+    response = await client.post(
+      '/webhook',
+      data=b' ' * (MOCK_CLIENT_MAX_SIZE + 1),
+      headers={
+        'Content-Type': 'application/json',
+        'x-topgg-signature': f't={t},{topgg.API_VERSION}={signature}',
+        'x-topgg-trace': MOCK_TRACE,
+      },
+    )
+
+    assert response.status == 413
+    assert (await response.json()).get('error') == 'Request body too large'
+
     response = await client.post(
       '/webhook',
       data='',
-      headers={'Content-Length': '2', 'Content-Type': 'application/json'},
+      headers={
+        'Content-Length': '2',
+        'Content-Type': 'application/json',
+        'x-topgg-signature': f't={t},{topgg.API_VERSION}={signature}',
+        'x-topgg-trace': MOCK_TRACE,
+      },
     )
 
     assert response.status == 408
     assert (await response.json()).get('error') == 'Request timed out'
 
 
+@pytest.mark.asyncio
+async def test_Webhooks_respects_app_client_max_size(
+  webhook_signature: WebhooksSignatureFixture,
+) -> None:
+  client_max_size = topgg.webhooks.DEFAULT_CLIENT_MAX_SIZE * 2
+  app = test_utils.TestClient(
+    test_utils.TestServer(web.Application(client_max_size=client_max_size))
+  )
+  wh = topgg.Webhooks('/webhook', MOCK_SECRET, app=app)
+
+  @wh.on(topgg.PayloadType.TEST)
+  async def handler(payload: topgg.TestPayload, trace: str) -> web.Response:
+    return web.Response(text='Test works')
+
+  await wh.start()
+
+  try:
+    with open(
+      join(CURRENT_DIR, 'mocks/test_payload.json'), 'r', encoding='utf-8'
+    ) as payload_file:
+      payload = payload_file.read()
+
+    payload = payload.ljust(topgg.webhooks.DEFAULT_CLIENT_MAX_SIZE + 1)
+    t, signature = webhook_signature(payload)
+
+    response = await app.post(
+      '/webhook',
+      data=payload,
+      headers={
+        'Content-Type': 'application/json',
+        'x-topgg-signature': f't={t},{topgg.API_VERSION}={signature}',
+        'x-topgg-trace': MOCK_TRACE,
+      },
+    )
+
+    assert response.status == 200
+    assert (await response.text()) == 'Test works'
+  finally:
+    await wh.close()
+
+
 @cache
 async def start_webhooks(webhooks: topgg.Webhooks):
   await webhooks.start()
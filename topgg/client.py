@@ -6,9 +6,9 @@ from aiohttp import ClientResponseError, ClientSession, ClientTimeout
 from typing import TYPE_CHECKING
 from datetime import datetime
 from asyncio import sleep
-from time import time
-from re import sub
-import json
+from time import monotonic
+from re import compile
+from json import JSONDecodeError
 
 if TYPE_CHECKING:
   from typing import Any
@@ -17,7 +17,7 @@ if TYPE_CHECKING:
 from .user import PaginatedVotes, PartialVote, UserSource
 from .errors import Error, Ratelimited, RequestError
 from .project import Announcement, Metrics, Project
-from .util import insert_locale_mapping
+from .util import insert_locale_mapping, json_dumps, json_loads
 from .ratelimiter import Ratelimiter
 from .version import VERSION
 from .locale import Locale
@@ -26,6 +26,8 @@ from .locale import Locale
 API_VERSION = 'v1'
 BASE_URL = f'https://top.gg/api/{API_VERSION}'
 MAXIMUM_DELAY_THRESHOLD = 5.0
+RATELIMITER_KEY_NUMBER_REGEX = compile(r'\d+')
+RATELIMITER_KEY_UNDERSCORE_REGEX = compile('_{2,}')
 
 
 class Client:
@@ -89,14 +91,14 @@ class Client:
     if self.__session.closed:
       raise Error('Client session is already closed.')
 
-    ratelimiter_key = sub(
-      '_{2,}', '_', sub(r'\d+', 'number', path).strip('/').replace('/', '_')
+    ratelimiter_key = RATELIMITER_KEY_UNDERSCORE_REGEX.sub(
+      '_', RATELIMITER_KEY_NUMBER_REGEX.sub('number', path).strip('/').replace('/', '_')
     )
 
     current_ratelimit = self.__current_ratelimits[ratelimiter_key]
 
     if current_ratelimit is not None:
-      current_time = time()
+      current_time = monotonic()
 
       if current_time < current_ratelimit:
         raise Ratelimited(current_ratelimit - current_time)
@@ -111,7 +113,7 @@ class Client:
       kwargs['params'] = params
 
     if body is not None:
-      kwargs['data'] = json.dumps(body)
+      kwargs['data'] = json_dumps(body)
 
     status = None
     retry_after = 0.0
@@ -133,12 +135,12 @@ class Client:
 
           try:
             try:
-              output = await resp.json()
+              output = await resp.json(loads=json_loads)
             except:
               pass
 
             retry_after = float(resp.headers.get('Retry-After', 0))
-          except (ValueError, json.decoder.JSONDecodeError):  # pragma: nocover
+          except (ValueError, JSONDecodeError):  # pragma: nocover
             pass
 
           resp.raise_for_status()
@@ -147,7 +149,7 @@ class Client:
       except ClientResponseError:
         if status == 429 and retry_after is not None:
           if retry_after > MAXIMUM_DELAY_THRESHOLD:
-            self.__current_ratelimits[ratelimiter_key] = time() + retry_after
+            self.__current_ratelimits[ratelimiter_key] = monotonic() + retry_after
 
             raise Ratelimited(retry_after) from None
           else:  # pragma: nocover
@@ -41,6 +41,9 @@ class IntegrationCreatePayload:
   def __eq__(self, other: object) -> bool:
     return isinstance(other, __class__) and self.connection_id == other.connection_id
 
+  def __hash__(self) -> int:
+    return hash(self.connection_id)
+
 
 class IntegrationDeletePayload:
   """An `integration.delete` webhook payload. Fires when a user has disconnected from your webhook integration."""
@@ -62,6 +65,9 @@ class IntegrationDeletePayload:
   def __eq__(self, other: object) -> bool:
     return isinstance(other, __class__) and self.connection_id == other.connection_id
 
+  def __hash__(self) -> int:
+    return hash(self.connection_id)
+
 
 class TestPayload:
   """A `webhook.test` webhook payload. Fires upon sent test from the project dashboard."""
@@ -129,6 +135,9 @@ class VoteCreatePayload:
   def __eq__(self, other: object) -> bool:
     return isinstance(other, __class__) and self.id == other.id
 
+  def __hash__(self) -> int:
+    return hash(self.id)
+
 
 Payload = (
   IntegrationCreatePayload | IntegrationDeletePayload | TestPayload | VoteCreatePayload
@@ -152,19 +161,12 @@ class PayloadType(Enum):
   """Fires when a user votes for your project."""
 
   def _deserialize(self, json: dict) -> Payload:
-    cls = None
-
-    match self:
-      case self.INTEGRATION_CREATE:
-        cls = IntegrationCreatePayload
-
-      case self.INTEGRATION_DELETE:
-        cls = IntegrationDeletePayload
-
-      case self.TEST:
-        cls = TestPayload
+    return PAYLOAD_CLASSES[self](json)
 
-      case self.VOTE_CREATE:
-        cls = VoteCreatePayload
 
-    return cls(json)
+PAYLOAD_CLASSES: dict[PayloadType, type[Payload]] = {
+  PayloadType.INTEGRATION_CREATE: IntegrationCreatePayload,
+  PayloadType.INTEGRATION_DELETE: IntegrationDeletePayload,
+  PayloadType.TEST: TestPayload,
+  PayloadType.VOTE_CREATE: VoteCreatePayload,
+}
@@ -55,6 +55,9 @@ class PartialProject:
   def __eq__(self, other: object) -> bool:
     return isinstance(other, __class__) and self.id == other.id
 
+  def __hash__(self) -> int:
+    return hash(self.id)
+
 
 class Project:
   """A project listed on Top.gg."""
@@ -123,6 +126,9 @@ class Project:
   def __eq__(self, other: object) -> bool:
     return isinstance(other, __class__) and self.id == other.id
 
+  def __hash__(self) -> int:
+    return hash(self.id)
+
 
 class Announcement:
   """A project's announcement."""
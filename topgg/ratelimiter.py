@@ -5,7 +5,7 @@
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 from collections import deque
-from time import time
+from time import monotonic
 import asyncio
 
 if TYPE_CHECKING:
@@ -21,45 +21,41 @@ class Ratelimiter:
 
   _max_calls: int
   _period: float = 1.0
-  _calls: deque[float] = field(default_factory=deque)
-  _lock: asyncio.Lock = asyncio.Lock()
-  _cancelled_delay: bool = field(default=False, init=False)
+  _calls: deque[float] = field(default_factory=deque, init=False)
 
   async def __aenter__(self) -> 'Ratelimiter':
     """Delays the request to this endpoint if it could lead to a ratelimit."""
 
-    async with self._lock:
-      if len(self._calls) >= self._max_calls:
-        now = time()
-        until = now + self._period - self._timespan
+    now = monotonic()
+    calls = self._calls
 
-        if (sleep_time := until - now) > 0:
-          if sleep_time <= (MAXIMUM_DELAY_THRESHOLD):
-            await asyncio.sleep(sleep_time)
-          else:
-            self._cancelled_delay = True
+    while calls and calls[0] <= now - self._period:
+      calls.popleft()
 
+    # Calls that are still being delayed are stored with the time they will be made at.
+    at = now if len(calls) < self._max_calls else calls[-self._max_calls] + self._period
+    sleep_time = at - now
+
+    if sleep_time > MAXIMUM_DELAY_THRESHOLD:
       return self
 
+    # Nothing is awaited until the call is recorded, so no lock is needed.
+    calls.append(at)
+
+    if sleep_time > 0:
+      try:
+        await asyncio.sleep(sleep_time)
+      except asyncio.CancelledError:
+        # This call will never be made, so it must not count towards the limit.
+        calls.remove(at)
+        raise
+
+    return self
+
   async def __aexit__(
     self,
     _exc_type: type[BaseException],
     _exc_val: BaseException,
     _exc_tb: 'TracebackType',
   ) -> None:
-    """Stores the previous request's timestamp."""
-
-    async with self._lock:
-      if self._cancelled_delay:
-        self._cancelled_delay = False
-      else:
-        self._calls.append(time())
-
-        while self._timespan >= self._period:
-          self._calls.popleft()
-
-  @property
-  def _timespan(self) -> float:
-    """The timespan between the first call and last call."""
-
-    return self._calls[-1] - self._calls[0]
+    pass
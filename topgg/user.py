@@ -84,7 +84,7 @@ class PaginatedVotes:
 
   def __init__(self, client: 'Client', json: dict):
     self.__client = client
-    self.__votes = [Vote(vote) for vote in json['data']]
+    self.__votes = list(map(Vote, json['data']))
     self.__cursor = json['cursor']
 
   async def next(self) -> 'PaginatedVotes':
@@ -142,3 +142,6 @@ class User:
 
   def __eq__(self, other: object) -> bool:
     return isinstance(other, __class__) and self.id == other.id
+
+  def __hash__(self) -> int:
+    return hash(self.id)
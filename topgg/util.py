@@ -10,6 +10,16 @@ if TYPE_CHECKING:
 
 from .locale import Locale
 
+try:
+  from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:
+  from json import dumps, loads as json_loads  # noqa: F401
+
+  def json_dumps(obj: 'Any') -> bytes:
+    """Serializes an object to compact UTF-8 JSON, matching orjson's output."""
+
+    return dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
 
 if version_info.major == 3 and version_info.minor <= 10:  # pragma: nocover
   from re import compile
@@ -17,16 +27,17 @@ if version_info.major == 3 and version_info.minor <= 10:  # pragma: nocover
   TIMESTAMP_MILLISECOND_FIX_REGEX = compile(r'\.(\d{4,})')
   TIMESTAMP_MILLISECOND_FIX_TRIMMER = lambda match: f'.{match.group(1)[:3]}'
 
+  def parse_timestamp(timestamp: str) -> datetime:
+    """Parses an ISO format timestamp to a Python datetime instance."""
 
-def parse_timestamp(timestamp: str) -> datetime:
-  """Parses an ISO format timestamp to a Python datetime instance."""
-
-  if version_info.major == 3 and version_info.minor <= 10:  # pragma: nocover
-    timestamp = TIMESTAMP_MILLISECOND_FIX_REGEX.sub(
-      TIMESTAMP_MILLISECOND_FIX_TRIMMER, timestamp
+    return datetime.fromisoformat(
+      TIMESTAMP_MILLISECOND_FIX_REGEX.sub(
+        TIMESTAMP_MILLISECOND_FIX_TRIMMER, timestamp
+      ).replace('Z', '+00:00')
     )
-
-  return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+else:
+  # Python 3.11+ natively accepts the trailing Z and any number of fractional digits.
+  parse_timestamp = datetime.fromisoformat
 
 
 def safe_dict(**kwargs: 'Any') -> dict:
@@ -6,12 +6,12 @@ from collections.abc import Awaitable, Callable
 from asyncio import wait_for, TimeoutError
 from inspect import iscoroutinefunction
 from aiohttp import test_utils, web
+from multidict import istr
 from typing import TYPE_CHECKING
 from hashlib import sha256
 from time import time
 import warnings
 import hmac
-import json
 
 if TYPE_CHECKING:
   from typing import Any, TypeAlias
@@ -24,6 +24,7 @@ from .payload import (
   PayloadType,
   VoteCreatePayload,
 )
+from .util import json_loads
 
 
 IntegrationCreateListener: 'TypeAlias' = Callable[
@@ -52,6 +53,25 @@ Listener: 'TypeAlias' = (
 )
 """All possible webhook listeners."""
 
+DEFAULT_CLIENT_MAX_SIZE = 2 * 1024 * 1024
+
+SIGNATURE_HEADER = istr('x-topgg-signature')
+TRACE_HEADER = istr('x-topgg-trace')
+
+REQUEST_TIMED_OUT = b'{"error":"Request timed out"}'
+REQUEST_BODY_TOO_LARGE = b'{"error":"Request body too large"}'
+MISSING_REQUIRED_HEADERS = b'{"error":"Missing required headers"}'
+INTERNAL_SERVER_ERROR = b'{"error":"Internal Server Error"}'
+INVALID_SIGNATURE = b'{"error":"Invalid signature"}'
+
+
+def error_response(body: bytes, status: int) -> web.Response:
+  """Creates a JSON error response from a pre-encoded body."""
+
+  return web.Response(
+    body=body, status=status, content_type='application/json', charset='utf-8'
+  )
+
 
 class Webhooks:
   """
@@ -131,7 +151,7 @@ class Webhooks:
     self.__host = host
     self.__port = port
     self.secret = secret
-    self.__app = app or web.Application(client_max_size=2 * 1024 * 1024)
+    self.__app = app or web.Application(client_max_size=DEFAULT_CLIENT_MAX_SIZE)
     self.__web_server = None
     self.__is_running = False
     self.__listeners = {}
@@ -214,61 +234,60 @@ class Webhooks:
     async def handler(request: web.Request) -> web.Response:
       current_timestamp = time()
 
-      body = None
-      payload_type = None
-      payload: 'Any' = None
-
-      try:
-        assert request.body_exists and request.has_body and request.can_read_body
-
-        body = await wait_for(request.text(), self.__timeout)
-        json_body = json.loads(body)
-
-        payload_type = PayloadType(json_body['type'])
-        payload = payload_type._deserialize(json_body['data'])
-      except TimeoutError:
-        return web.json_response({'error': 'Request timed out'}, status=408)
-      except web.HTTPRequestEntityTooLarge:  # pragma: nocover
-        return web.json_response({'error': 'Request body too large'}, status=413)
-      except Exception as err:  # pragma: nocover
-        warnings.warn(
-          f'Unable to parse Top.gg webhook payload. Please report this bug to the SDK maintainers.\nCause: {err}\n--- BEGIN BODY DUMP ---\n{body}\n--- END BODY DUMP ---'
-        )
-
-        return web.Response(status=204)
-
-      signature = request.headers.get('x-topgg-signature')
-      trace = request.headers.get('x-topgg-trace')
+      signature = request.headers.get(SIGNATURE_HEADER)
+      trace = request.headers.get(TRACE_HEADER)
 
       if not signature or not trace:
-        return web.json_response({'error': 'Missing required headers'}, status=401)
-
-      fail_status = 422
+        return error_response(MISSING_REQUIRED_HEADERS, 401)
 
+      # Everything that does not need the body is checked before reading it.
       try:
         signature = {
           key: value
-          for key, value in map(lambda pair: pair.split('='), signature.split(','))
+          for key, _, value in (pair.partition('=') for pair in signature.split(','))
         }
 
         t = int(signature['t'])
-        signature = signature[API_VERSION]
+        signature = signature[API_VERSION].encode('utf-8', 'surrogateescape')
 
         assert signature
 
-        fail_status = 400
+        is_stale = abs(current_timestamp - t) > self.__timestamp_window
+      except Exception:
+        return error_response(INVALID_SIGNATURE, 422)
 
-        hm = hmac.new(self.__secret, f'{t}.{body}'.encode('utf-8'), digestmod=sha256)
+      if is_stale:
+        return error_response(INVALID_SIGNATURE, 403)
 
-        fail_status = 403
+      if (request.content_length or 0) > request.client_max_size:
+        return error_response(REQUEST_BODY_TOO_LARGE, 413)
+
+      try:
+        body = await wait_for(request.read(), self.__timeout)
+      except TimeoutError:
+        return error_response(REQUEST_TIMED_OUT, 408)
+      except web.HTTPRequestEntityTooLarge:  # pragma: nocover
+        return error_response(REQUEST_BODY_TOO_LARGE, 413)
 
-        assert abs(
-          current_timestamp - t
-        ) <= self.__timestamp_window and hmac.compare_digest(hm.hexdigest(), signature)
+      try:
+        hm = hmac.new(self.__secret, b'%d.%b' % (t, body), digestmod=sha256)
       except RuntimeError:  # pragma: nocover
-        return web.json_response({'error': 'Internal Server Error'}, status=500)
-      except Exception:
-        return web.json_response({'error': 'Invalid signature'}, status=fail_status)
+        return error_response(INTERNAL_SERVER_ERROR, 500)
+
+      if not hmac.compare_digest(hm.hexdigest().encode(), signature):
+        return error_response(INVALID_SIGNATURE, 403)
+
+      try:
+        json_body = json_loads(body)
+
+        payload_type = PayloadType(json_body['type'])
+        payload: 'Any' = payload_type._deserialize(json_body['data'])
+      except Exception as err:  # pragma: nocover
+        warnings.warn(
+          f'Unable to parse Top.gg webhook payload. Please report this bug to the SDK maintainers.\nCause: {err}\n--- BEGIN BODY DUMP ---\n{body.decode("utf-8", "replace")}\n--- END BODY DUMP ---'
+        )
+
+        return web.Response(status=204)
 
       response = None
 
@@ -10,6 +10,12 @@ if TYPE_CHECKING:
   from .project import Platform
 
 
+LARGE_WIDGET_URL = f'{BASE_URL}/widgets/large'
+VOTES_WIDGET_URL = f'{BASE_URL}/widgets/small/votes'
+OWNER_WIDGET_URL = f'{BASE_URL}/widgets/small/owner'
+SOCIAL_WIDGET_URL = f'{BASE_URL}/widgets/small/social'
+
+
 class Widget:
   """A Top.gg widget URL generator."""
 
@@ -38,7 +44,7 @@ class Widget:
         "The specified platform, project type, and/or project ID's type is invalid."
       )
 
-    return f'{BASE_URL}/widgets/large/{platform.value}/{project_type.value}/{id}'
+    return f'{LARGE_WIDGET_URL}/{platform.value}/{project_type.value}/{id}'
 
   @staticmethod
   def votes(platform: 'Platform', project_type: ProjectType, id: int) -> str:
@@ -63,7 +69,7 @@ class Widget:
         "The specified platform, project type, and/or project ID's type is invalid."
       )
 
-    return f'{BASE_URL}/widgets/small/votes/{platform.value}/{project_type.value}/{id}'
+    return f'{VOTES_WIDGET_URL}/{platform.value}/{project_type.value}/{id}'
 
   @staticmethod
   def owner(platform: 'Platform', project_type: ProjectType, id: int) -> str:
@@ -88,7 +94,7 @@ class Widget:
         "The specified platform, project type, and/or project ID's type is invalid."
       )
 
-    return f'{BASE_URL}/widgets/small/owner/{platform.value}/{project_type.value}/{id}'
+    return f'{OWNER_WIDGET_URL}/{platform.value}/{project_type.value}/{id}'
 
   @staticmethod
   def social(platform: 'Platform', project_type: ProjectType, id: int) -> str:
@@ -113,4 +119,4 @@ class Widget:
         "The specified platform, project type, and/or project ID's type is invalid."
       )
 
-    return f'{BASE_URL}/widgets/small/social/{platform.value}/{project_type.value}/{id}'
+    return f'{SOCIAL_WIDGET_URL}/{platform.value}/{project_type.value}/{id}'